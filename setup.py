@@ -0,0 +1,30 @@
+"""Build script. The default build is pure Python (metadata lives in pyproject.toml).
+
+Set RARB_MYPYC=1 to compile the risk hot path (rarb.risk.manager) to a C
+extension with mypyc, which ships with the mypy dev dependency:
+
+    RARB_MYPYC=1 pip install -e .
+
+The module is fully typed, so mypyc compiles it without source changes;
+position_size / check_circuit_breakers / pre_trade_filters run on every
+market tick, which is where the interpreter-elimination win lands.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("RARB_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            # Interpreted imports (logging, config) are resolved at runtime;
+            # don't require their stubs to be visible to the mypyc build.
+            "--ignore-missing-imports",
+            "src/rarb/risk/manager.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,19 +1,32 @@
-"""Configuration management for rarb."""
+"""Configuration management for rarb.
 
+Pydantic validates settings once at load time (env parsing, range checks,
+address/key format); the rest of the code reads a frozen slotted dataclass
+snapshot, so hot-path attribute access skips pydantic's descriptor machinery.
+"""
+
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+
+    Load-and-validate only: use get_settings() for the FrozenSettings
+    snapshot that the rest of the code reads.
+    """
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # Both settings models read the same .env; each must ignore the
+        # other's keys instead of raising extra_forbidden.
+        extra="ignore",
     )
 
     # Wallet Configuration
@@ -200,6 +213,56 @@ class Settings(BaseSettings):
         description="Polymarket API passphrase for L2 authentication",
     )
 
+    # Mode
+    dry_run: bool = Field(
+        default=True,
+        description="If true, simulate trades without executing",
+    )
+
+    # Logging
+    log_level: str = Field(
+        default="INFO",
+        description="Logging level (DEBUG, INFO, WARNING, ERROR)",
+    )
+
+    @field_validator("wallet_address", mode="before")
+    @classmethod
+    def validate_wallet_address(cls, v: Optional[str]) -> Optional[str]:
+        if v is None or v == "":
+            return None
+        if not v.startswith("0x") or len(v) != 42:
+            raise ValueError("Wallet address must be a valid Ethereum address (0x + 40 hex chars)")
+        return v.lower()
+
+    @field_validator("private_key", mode="before")
+    @classmethod
+    def validate_private_key(cls, v: Optional[str]) -> Optional[str]:
+        if v is None or v == "":
+            return None
+        if not v.startswith("0x"):
+            raise ValueError("Private key must start with 0x")
+        if len(v) != 66:  # 0x + 64 hex chars
+            raise ValueError("Private key must be 32 bytes (64 hex chars + 0x prefix)")
+        return v
+
+
+class IntegrationsSettings(BaseSettings):
+    """Optional integration settings (alerts, dashboard, SOCKS5 proxy).
+
+    Split from Settings so the pydantic model (env parsing, SecretStr
+    wrappers) is only constructed on first use - most runs never touch
+    telegram/slack and the core startup path skips this schema entirely.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        # Both settings models read the same .env; each must ignore the
+        # other's keys instead of raising extra_forbidden.
+        extra="ignore",
+    )
+
     # Alerts (optional)
     telegram_bot_token: Optional[str] = Field(
         default=None,
@@ -214,12 +277,6 @@ class Settings(BaseSettings):
         description="Slack webhook URL for notifications",
     )
 
-    # Mode
-    dry_run: bool = Field(
-        default=True,
-        description="If true, simulate trades without executing",
-    )
-
     # Dashboard
     dashboard_username: str = Field(
         default="admin",
@@ -234,12 +291,6 @@ class Settings(BaseSettings):
         description="Dashboard web server port",
     )
 
-    # Logging
-    log_level: str = Field(
-        default="INFO",
-        description="Logging level (DEBUG, INFO, WARNING, ERROR)",
-    )
-
     # SOCKS5 Proxy (for routing order API calls through non-US server)
     socks5_proxy_host: Optional[str] = Field(
         default=None,
@@ -258,66 +309,244 @@ class Settings(BaseSettings):
         description="SOCKS5 proxy password (if authentication required)",
     )
 
-    @field_validator("wallet_address", mode="before")
-    @classmethod
-    def validate_wallet_address(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v == "":
-            return None
-        if not v.startswith("0x") or len(v) != 42:
-            raise ValueError("Wallet address must be a valid Ethereum address (0x + 40 hex chars)")
-        return v.lower()
 
-    @field_validator("private_key", mode="before")
-    @classmethod
-    def validate_private_key(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v == "":
-            return None
-        if not v.startswith("0x"):
-            raise ValueError("Private key must start with 0x")
-        if len(v) != 66:  # 0x + 64 hex chars
-            raise ValueError("Private key must be 32 bytes (64 hex chars + 0x prefix)")
-        return v
+def _build_socks5_url(
+    host: Optional[str],
+    port: int,
+    user: Optional[str],
+    password: Optional[SecretStr],
+) -> Optional[str]:
+    """Build the SOCKS5 proxy URL, or None if no proxy is configured.
 
-    def is_trading_enabled(self) -> bool:
-        """Check if Polymarket trading credentials are configured."""
-        return self.private_key is not None and self.wallet_address is not None
+    Uses socks5h:// scheme to ensure DNS resolution happens through the proxy,
+    which is required for geo-restriction bypass.
+    """
+    if not host:
+        return None
+    if user and password:
+        return f"socks5h://{user}:{password.get_secret_value()}@{host}:{port}"
+    return f"socks5h://{host}:{port}"
 
-    def get_socks5_proxy_url(self) -> Optional[str]:
-        """Get SOCKS5 proxy URL if configured.
 
-        Uses socks5h:// scheme to ensure DNS resolution happens through the proxy,
-        which is required for geo-restriction bypass.
-        """
-        if not self.socks5_proxy_host:
-            return None
-        if self.socks5_proxy_user and self.socks5_proxy_pass:
-            password = self.socks5_proxy_pass.get_secret_value()
-            return f"socks5h://{self.socks5_proxy_user}:{password}@{self.socks5_proxy_host}:{self.socks5_proxy_port}"
-        return f"socks5h://{self.socks5_proxy_host}:{self.socks5_proxy_port}"
+@dataclass(frozen=True, slots=True)
+class FrozenIntegrations:
+    """Validated integrations snapshot. Mirrors IntegrationsSettings.
+
+    The proxy URL and enablement flag are precomputed at build time - the
+    inputs never change at runtime, so HTTP client setup gets a stored
+    string instead of rebuilding it (and re-reading the SecretStr) per call.
+    """
+
+    telegram_bot_token: Optional[str]
+    telegram_chat_id: Optional[str]
+    slack_webhook_url: Optional[str]
+    dashboard_username: str
+    dashboard_password: str
+    dashboard_port: int
+    socks5_proxy_host: Optional[str]
+    socks5_proxy_port: int
+    socks5_proxy_user: Optional[str]
+    socks5_proxy_pass: Optional[SecretStr]
+    socks5_proxy_url: Optional[str]
+    proxy_enabled: bool
+
+    def get_socks5_proxy_url(self) -> Optional[str]:
+        """Get SOCKS5 proxy URL if configured (socks5h:// for proxy-side DNS)."""
+        return self.socks5_proxy_url
 
     def is_proxy_enabled(self) -> bool:
         """Check if SOCKS5 proxy is configured."""
-        return self.socks5_proxy_host is not None
+        return self.proxy_enabled
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSettings:
+    """Validated settings snapshot. Mirrors Settings field-for-field.
+
+    Plain slotted dataclass: attribute access is a straight slot read with no
+    pydantic descriptor overhead, which matters on the per-tick risk path.
+    """
+
+    # Wallet Configuration
+    private_key: Optional[SecretStr]
+    wallet_address: Optional[str]
+
+    # Network Configuration
+    polygon_rpc_url: str
+    chain_id: int
+
+    # Trading Parameters
+    min_profit_threshold: float
+    max_position_size: float
+    poll_interval_seconds: float
+    min_liquidity_usd: float
+    max_days_until_resolution: int
+
+    # Risk management
+    risk_per_trade_pct: float
+    stop_loss_pct: float
+    time_stop_seconds: int
+    position_cap_pct: float
+    take_profit_pct_to_one: float
+    take_profit_first_portion_pct: float
+    consecutive_losses_pause: int
+    consecutive_loss_pause_minutes: int
+    session_drawdown_pct: float
+    session_pause_minutes: int
+    daily_drawdown_pct: float
+    monthly_drawdown_pct: float
+    volatility_skip_1min_std: Optional[float]
+    min_seconds_until_resolution: int
+    min_volume_60s_usd: Optional[float]
+    max_zscore_3min: Optional[float]
+    max_rsi_overbought: Optional[float]
+
+    num_ws_connections: int
+
+    # API Endpoints
+    clob_base_url: str
+    gamma_base_url: str
+
+    # Polymarket API Credentials (L2 Auth)
+    poly_api_key: Optional[str]
+    poly_api_secret: Optional[SecretStr]
+    poly_api_passphrase: Optional[SecretStr]
+
+    # Mode
+    dry_run: bool
+
+    # Logging
+    log_level: str
+
+    # Precomputed at build time
+    trading_enabled: bool
+
+    def is_trading_enabled(self) -> bool:
+        """Check if Polymarket trading credentials are configured."""
+        return self.trading_enabled
 
     def is_kalshi_enabled(self) -> bool:
         """Check if Kalshi is configured. Deprecated - always returns False."""
         return False
 
+    # --- Integrations (lazy) ---
+    # Delegating properties keep the old flat-settings API while deferring
+    # IntegrationsSettings construction to first use.
+
+    @property
+    def telegram_bot_token(self) -> Optional[str]:
+        return get_integrations_settings().telegram_bot_token
+
+    @property
+    def telegram_chat_id(self) -> Optional[str]:
+        return get_integrations_settings().telegram_chat_id
+
+    @property
+    def slack_webhook_url(self) -> Optional[str]:
+        return get_integrations_settings().slack_webhook_url
+
+    @property
+    def dashboard_username(self) -> str:
+        return get_integrations_settings().dashboard_username
+
+    @property
+    def dashboard_password(self) -> str:
+        return get_integrations_settings().dashboard_password
 
-# Global settings instance
-_settings: Optional[Settings] = None
+    @property
+    def dashboard_port(self) -> int:
+        return get_integrations_settings().dashboard_port
 
+    @property
+    def socks5_proxy_host(self) -> Optional[str]:
+        return get_integrations_settings().socks5_proxy_host
+
+    @property
+    def socks5_proxy_port(self) -> int:
+        return get_integrations_settings().socks5_proxy_port
+
+    @property
+    def socks5_proxy_user(self) -> Optional[str]:
+        return get_integrations_settings().socks5_proxy_user
+
+    @property
+    def socks5_proxy_pass(self) -> Optional[SecretStr]:
+        return get_integrations_settings().socks5_proxy_pass
+
+    def get_socks5_proxy_url(self) -> Optional[str]:
+        """Get SOCKS5 proxy URL if configured (socks5h:// for proxy-side DNS)."""
+        return get_integrations_settings().get_socks5_proxy_url()
+
+    def is_proxy_enabled(self) -> bool:
+        """Check if SOCKS5 proxy is configured."""
+        return get_integrations_settings().is_proxy_enabled()
 
-def get_settings() -> Settings:
+
+def _build_settings() -> FrozenSettings:
+    """Validate settings through pydantic, then freeze into the snapshot."""
+    validated = Settings()
+    return FrozenSettings(
+        **validated.model_dump(),
+        trading_enabled=(
+            validated.private_key is not None and validated.wallet_address is not None
+        ),
+    )
+
+
+def _build_integrations_settings() -> FrozenIntegrations:
+    """Validate integrations through pydantic, then freeze into the snapshot."""
+    validated = IntegrationsSettings()
+    return FrozenIntegrations(
+        **validated.model_dump(),
+        socks5_proxy_url=_build_socks5_url(
+            validated.socks5_proxy_host,
+            validated.socks5_proxy_port,
+            validated.socks5_proxy_user,
+            validated.socks5_proxy_pass,
+        ),
+        proxy_enabled=validated.socks5_proxy_host is not None,
+    )
+
+
+# Global settings instances (integrations are built lazily on first access)
+_settings: Optional[FrozenSettings] = None
+_integrations: Optional[FrozenIntegrations] = None
+
+# Hooks invoked with the new snapshot on every reload_settings(), so derived
+# snapshots (e.g. rarb.risk.constants) can never disagree with live settings.
+_reload_hooks: list[Callable[[FrozenSettings], None]] = []
+
+
+def register_reload_hook(hook: Callable[[FrozenSettings], None]) -> None:
+    """Register a callable invoked with the new snapshot after each reload."""
+    _reload_hooks.append(hook)
+
+
+def get_settings() -> FrozenSettings:
     """Get the global settings instance."""
     global _settings
     if _settings is None:
-        _settings = Settings()
+        _settings = _build_settings()
     return _settings
 
 
-def reload_settings() -> Settings:
-    """Reload settings from environment."""
-    global _settings
-    _settings = Settings()
+def get_integrations_settings() -> FrozenIntegrations:
+    """Get the global integrations settings, built on first call."""
+    global _integrations
+    if _integrations is None:
+        _integrations = _build_integrations_settings()
+    return _integrations
+
+
+def reload_settings() -> FrozenSettings:
+    """Reload settings from environment.
+
+    Registered reload hooks run afterwards, so derived snapshots (risk
+    constants, pre-trade filters) stay in sync with the new settings.
+    """
+    global _settings, _integrations
+    _settings = _build_settings()
+    _integrations = None
+    for hook in _reload_hooks:
+        hook(_settings)
     return _settings
@@ -0,0 +1,56 @@
+"""Risk thresholds snapshotted from settings as module-level constants.
+
+Reading a module global is the cheapest lookup CPython offers, and these
+values gate every market tick. The values below are placeholders until the
+first refresh(): RiskManager.__init__ refreshes from its bound settings,
+and reload_settings() re-snapshots via the registered reload hook. Nothing
+runs at import, so importing rarb.risk neither constructs settings nor
+surfaces env validation errors early.
+"""
+
+from typing import Optional
+
+from rarb.config import FrozenSettings, get_settings, register_reload_hook
+
+# Position sizing (fractions of account / USD)
+RISK_PER_TRADE_FRAC: float = 0.0
+STOP_FRAC: float = 0.0
+ONE_MINUS_STOP: float = 1.0
+CAP_FRAC: float = 0.0
+MAX_USD: float = 0.0
+
+# Circuit breakers (percentages, matching the settings fields)
+SESSION_DD_PCT: float = 0.0
+DAILY_DD_PCT: float = 0.0
+MONTHLY_DD_PCT: float = 0.0
+VOL_SKIP_STD: Optional[float] = None
+
+# Pause / loss-streak parameters
+SESSION_PAUSE_MINUTES: int = 0
+CONSECUTIVE_LOSSES_PAUSE: int = 0
+CONSECUTIVE_LOSS_PAUSE_MINUTES: int = 0
+
+
+def refresh(settings: Optional[FrozenSettings] = None) -> None:
+    """Re-snapshot the constants from settings (call after reload_settings)."""
+    global RISK_PER_TRADE_FRAC, STOP_FRAC, ONE_MINUS_STOP, CAP_FRAC, MAX_USD
+    global SESSION_DD_PCT, DAILY_DD_PCT, MONTHLY_DD_PCT, VOL_SKIP_STD
+    global SESSION_PAUSE_MINUTES, CONSECUTIVE_LOSSES_PAUSE, CONSECUTIVE_LOSS_PAUSE_MINUTES
+
+    s = settings if settings is not None else get_settings()
+    RISK_PER_TRADE_FRAC = s.risk_per_trade_pct / 100
+    STOP_FRAC = s.stop_loss_pct / 100
+    ONE_MINUS_STOP = 1.0 - STOP_FRAC
+    CAP_FRAC = s.position_cap_pct / 100
+    MAX_USD = s.max_position_size
+    SESSION_DD_PCT = s.session_drawdown_pct
+    DAILY_DD_PCT = s.daily_drawdown_pct
+    MONTHLY_DD_PCT = s.monthly_drawdown_pct
+    VOL_SKIP_STD = s.volatility_skip_1min_std
+    SESSION_PAUSE_MINUTES = s.session_pause_minutes
+    CONSECUTIVE_LOSSES_PAUSE = s.consecutive_losses_pause
+    CONSECUTIVE_LOSS_PAUSE_MINUTES = s.consecutive_loss_pause_minutes
+
+
+# Re-snapshot whenever settings are reloaded, so these can never go stale.
+register_reload_hook(refresh)
@@ -10,15 +10,21 @@ Implements:
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Callable, Optional
 
-from rarb.config import get_settings
+from rarb.config import FrozenSettings, get_settings, register_reload_hook, reload_settings
+from rarb.risk import constants as rc
 from rarb.utils.logging import get_logger
 
 log = get_logger(__name__)
 
 
-@dataclass
+def _usd_cents(shares: int, entry: float) -> int:
+    """Position cost in whole cents, rounded down (matches Decimal ROUND_DOWN)."""
+    return int(shares * entry * 100 + 1e-9)
+
+
+@dataclass(frozen=True, slots=True)
 class PreTradeFilterResult:
     """Result of pre-trade filters. allowed=False means skip the trade."""
 
@@ -26,6 +32,89 @@ class PreTradeFilterResult:
     reason: str = ""
 
 
+# Shared result for the common "all filters passed" case; frozen, so safe to
+# return from every call without allocating.
+_ALLOWED = PreTradeFilterResult(allowed=True, reason="")
+
+# Shared happy-path result for check_circuit_breakers; saves a tuple
+# allocation per market per poll.
+_CB_OK: tuple[bool, str] = (True, "")
+
+
+# A filter gets (seconds_until_resolution, volume_60s_usd, zscore_3min, rsi_8)
+# and returns a rejection reason, or None to allow.
+_FilterFn = Callable[
+    [Optional[float], Optional[float], Optional[float], Optional[float]], Optional[str]
+]
+
+
+def _build_pre_trade_filters(settings: FrozenSettings) -> list[_FilterFn]:
+    """
+    Build the list of enabled pre-trade filters once per settings load.
+
+    Filters disabled by config (None thresholds) are simply not in the list,
+    so pre_trade_filters loops over active checks only instead of re-testing
+    every threshold on every call.
+    """
+    filters: list[_FilterFn] = []
+
+    min_secs = settings.min_seconds_until_resolution
+    if min_secs > 0:
+
+        def _time_filter(secs, vol, z, rsi, _min=min_secs):  # type: ignore[no-untyped-def]
+            if secs is not None and secs < _min:
+                return f"time_to_resolution: {secs:.0f}s < {_min}s"
+            return None
+
+        filters.append(_time_filter)
+
+    min_vol = settings.min_volume_60s_usd
+    if min_vol is not None:
+
+        def _volume_filter(secs, vol, z, rsi, _min=min_vol):  # type: ignore[no-untyped-def]
+            if vol is not None and vol < _min:
+                return f"volume_60s: ${vol:.0f} < ${_min}"
+            return None
+
+        filters.append(_volume_filter)
+
+    max_z = settings.max_zscore_3min
+    if max_z is not None:
+
+        def _zscore_filter(secs, vol, z, rsi, _max=max_z):  # type: ignore[no-untyped-def]
+            if z is not None and abs(z) > _max:
+                return f"zscore_3min: {z:.2f} > {_max}"
+            return None
+
+        filters.append(_zscore_filter)
+
+    max_rsi = settings.max_rsi_overbought
+    if max_rsi is not None:
+
+        def _rsi_filter(secs, vol, z, rsi, _max=max_rsi):  # type: ignore[no-untyped-def]
+            if rsi is not None and rsi > _max:
+                return f"rsi_overbought: {rsi:.1f} > {_max}"
+            return None
+
+        filters.append(_rsi_filter)
+
+    return filters
+
+
+# Active filters are module state (like rarb.risk.constants) so that a bare
+# config.reload_settings() keeps them in sync via the reload hook, with no
+# per-instance re-binding step to forget.
+_active_filters: list[_FilterFn] = []
+
+
+def _rebuild_filters(settings: FrozenSettings) -> None:
+    global _active_filters
+    _active_filters = _build_pre_trade_filters(settings)
+
+
+register_reload_hook(_rebuild_filters)
+
+
 class RiskManager:
     """
     Layered risk control: per-trade position sizing, circuit breakers, and pre-trade filters.
@@ -33,14 +122,38 @@ class RiskManager:
     State is session-scoped (consecutive losses, pause until, session/daily/monthly start balances).
     """
 
+    __slots__ = (
+        "_consecutive_losses",
+        "_pause_until",
+        "_session_start_balance",
+        "_daily_start_balance",
+        "_monthly_start_balance",
+        "_last_daily_ord",
+        "_last_monthly_key",
+    )
+
     def __init__(self) -> None:
+        # Snapshot current settings into the module-level constants and filter
+        # list; reload hooks keep both in sync after any reload_settings().
+        settings = get_settings()
+        rc.refresh(settings)
+        _rebuild_filters(settings)
         self._consecutive_losses: int = 0
         self._pause_until: Optional[datetime] = None
         self._session_start_balance: Optional[Decimal] = None
         self._daily_start_balance: Optional[Decimal] = None
         self._monthly_start_balance: Optional[Decimal] = None
-        self._last_daily_date: Optional[str] = None
-        self._last_monthly_key: Optional[str] = None
+        self._last_daily_ord: Optional[int] = None
+        self._last_monthly_key: Optional[int] = None
+
+    def reload_settings_ref(self) -> None:
+        """Reload settings (mirrors config.reload_settings).
+
+        The reload hooks refresh the risk constants and filter list, so a bare
+        config.reload_settings() is equivalent; this is kept for callers that
+        reload via the manager.
+        """
+        reload_settings()
 
     def is_paused(self) -> bool:
         """True if we are in a cooldown (consecutive losses or drawdown pause)."""
@@ -56,16 +169,17 @@ class RiskManager:
         """When the current pause ends (UTC). None if not paused."""
         return self._pause_until
 
-    def _ensure_session_daily_monthly(self, current_balance: Decimal) -> None:
-        now = datetime.now(timezone.utc)
-        today = now.strftime("%Y-%m-%d")
-        month_key = now.strftime("%Y-%m")
+    def _ensure_session_daily_monthly(self, current_balance: Decimal, now: datetime) -> None:
+        # Integer composites (YYYYMMDD / YYYYMM) bucket identically to the old
+        # date strings but skip string formatting and compare as ints.
+        month_key = now.year * 100 + now.month
+        daily_ord = month_key * 100 + now.day
 
         if self._session_start_balance is None:
             self._session_start_balance = current_balance
-        if self._last_daily_date != today:
+        if self._last_daily_ord != daily_ord:
             self._daily_start_balance = current_balance
-            self._last_daily_date = today
+            self._last_daily_ord = daily_ord
         if self._last_monthly_key != month_key:
             self._monthly_start_balance = current_balance
             self._last_monthly_key = month_key
@@ -80,8 +194,8 @@ class RiskManager:
         Check session/daily/monthly drawdown and volatility kill.
         Returns (allowed, reason). allowed=False means do not take new trades.
         """
-        settings = get_settings()
-        self._ensure_session_daily_monthly(current_balance)
+        now = datetime.now(timezone.utc)
+        self._ensure_session_daily_monthly(current_balance, now)
         assert self._session_start_balance is not None
         assert self._daily_start_balance is not None
         assert self._monthly_start_balance is not None
@@ -91,12 +205,10 @@ class RiskManager:
             session_pnl_pct = float(
                 (current_balance - self._session_start_balance) / self._session_start_balance * 100
             )
-            if session_pnl_pct <= -settings.session_drawdown_pct:
-                self._pause_until = datetime.now(timezone.utc) + timedelta(
-                    minutes=settings.session_pause_minutes
-                )
+            if session_pnl_pct <= -rc.SESSION_DD_PCT:
+                self._pause_until = now + timedelta(minutes=rc.SESSION_PAUSE_MINUTES)
                 return False, (
-                    f"session_drawdown: {session_pnl_pct:.2f}% <= -{settings.session_drawdown_pct}%"
+                    f"session_drawdown: {session_pnl_pct:.2f}% <= -{rc.SESSION_DD_PCT}%"
                 )
 
         # Daily drawdown
@@ -104,14 +216,14 @@ class RiskManager:
             daily_pnl_pct = float(
                 (current_balance - self._daily_start_balance) / self._daily_start_balance * 100
             )
-            if daily_pnl_pct <= -settings.daily_drawdown_pct:
+            if daily_pnl_pct <= -rc.DAILY_DD_PCT:
                 # Stop for the day: pause until next UTC day
-                tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+                tomorrow = (now + timedelta(days=1)).replace(
                     hour=0, minute=0, second=0, microsecond=0
                 )
                 self._pause_until = tomorrow
                 return False, (
-                    f"daily_drawdown: {daily_pnl_pct:.2f}% <= -{settings.daily_drawdown_pct}%"
+                    f"daily_drawdown: {daily_pnl_pct:.2f}% <= -{rc.DAILY_DD_PCT}%"
                 )
 
         # Monthly drawdown
@@ -121,21 +233,21 @@ class RiskManager:
                 / self._monthly_start_balance
                 * 100
             )
-            if monthly_pnl_pct <= -settings.monthly_drawdown_pct:
+            if monthly_pnl_pct <= -rc.MONTHLY_DD_PCT:
                 return False, (
-                    f"monthly_drawdown: {monthly_pnl_pct:.2f}% <= -{settings.monthly_drawdown_pct}% "
+                    f"monthly_drawdown: {monthly_pnl_pct:.2f}% <= -{rc.MONTHLY_DD_PCT}% "
                     "(halt bot - manual review required)"
                 )
 
         # Volatility kill
-        if settings.volatility_skip_1min_std is not None and volatility_1min_std is not None:
-            if volatility_1min_std > settings.volatility_skip_1min_std:
+        if rc.VOL_SKIP_STD is not None and volatility_1min_std is not None:
+            if volatility_1min_std > rc.VOL_SKIP_STD:
                 return False, (
                     f"volatility_kill: 1min_std={volatility_1min_std:.4f} > "
-                    f"{settings.volatility_skip_1min_std}"
+                    f"{rc.VOL_SKIP_STD}"
                 )
 
-        return True, ""
+        return _CB_OK
 
     def record_trade(self, success: bool, pnl: Decimal = Decimal("0")) -> None:
         """
@@ -147,22 +259,21 @@ class RiskManager:
             self._consecutive_losses = 0
             return
 
-        settings = get_settings()
         self._consecutive_losses += 1
         log.info(
             "Consecutive loss recorded",
             count=self._consecutive_losses,
-            limit=settings.consecutive_losses_pause,
+            limit=rc.CONSECUTIVE_LOSSES_PAUSE,
             pnl=float(pnl),
         )
-        if self._consecutive_losses >= settings.consecutive_losses_pause:
+        if self._consecutive_losses >= rc.CONSECUTIVE_LOSSES_PAUSE:
             self._pause_until = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.consecutive_loss_pause_minutes
+                minutes=rc.CONSECUTIVE_LOSS_PAUSE_MINUTES
             )
             log.warning(
                 "Circuit breaker: pausing after consecutive losses",
                 consecutive=self._consecutive_losses,
-                pause_minutes=settings.consecutive_loss_pause_minutes,
+                pause_minutes=rc.CONSECUTIVE_LOSS_PAUSE_MINUTES,
             )
 
     def position_size(
@@ -185,43 +296,49 @@ class RiskManager:
 
         Returns (shares, usd_amount).
         """
-        settings = get_settings()
-        risk_frac = (risk_fraction if risk_fraction is not None else settings.risk_per_trade_pct / 100)
+        risk_frac = risk_fraction if risk_fraction is not None else rc.RISK_PER_TRADE_FRAC
         cap_frac = (
-            position_cap_fraction
-            if position_cap_fraction is not None
-            else settings.position_cap_pct / 100
+            position_cap_fraction if position_cap_fraction is not None else rc.CAP_FRAC
         )
-        max_usd = max_position_usd if max_position_usd is not None else settings.max_position_size
-
-        if stop_price is None:
+        max_usd = max_position_usd if max_position_usd is not None else rc.MAX_USD
+
+        # Hot path runs in float (Decimal ops are 30-100x slower); shares are
+        # integer and USD is cents, so only the returned values are Decimal.
+        balance = float(account_balance)
+        entry = float(entry_price)
+        if stop_price is not None:
+            stop = float(stop_price)
+        else:
             # Fixed % stop: stop_price = entry * (1 - stop_pct/100)
-            stop_pct = Decimal(str(settings.stop_loss_pct / 100))
-            stop_price = entry_price * (Decimal("1") - stop_pct)
+            stop = entry * rc.ONE_MINUS_STOP
 
-        risk_distance = entry_price - stop_price
+        risk_distance = entry - stop
         if risk_distance <= 0:
             log.warning("Risk distance <= 0, using minimal size")
-            risk_distance = entry_price * Decimal("0.01")
-
-        risk_per_trade = account_balance * Decimal(str(risk_frac))
-        shares = (risk_per_trade / risk_distance).quantize(Decimal("1"), rounding="ROUND_DOWN")
-        usd_amount = (shares * entry_price).quantize(Decimal("0.01"), rounding="ROUND_DOWN")
-
-        # Cap by % of account
-        cap_usd = account_balance * Decimal(str(cap_frac))
-        if usd_amount > cap_usd and cap_usd > 0:
-            usd_amount = cap_usd
-            shares = (usd_amount / entry_price).quantize(Decimal("1"), rounding="ROUND_DOWN")
-            usd_amount = (shares * entry_price).quantize(Decimal("0.01"), rounding="ROUND_DOWN")
+            risk_distance = entry * 0.01
+
+        # Whole-share / whole-cent amounts stay in plain ints until the return,
+        # replacing the old per-call Decimal quantize round-trips.
+        # The 1e-9 tolerance keeps integer-valued quotients from losing a share
+        # to float representation error before truncation.
+        risk_per_trade = balance * risk_frac
+        shares = int(risk_per_trade / risk_distance + 1e-9)
+        usd_cents = _usd_cents(shares, entry)
+
+        # Cap by % of account. Floor shares against the un-rounded cap: rounding
+        # the cap to whole cents first can round it up past a share boundary and
+        # let the position cost exceed the configured limit.
+        cap_usd_exact = balance * cap_frac
+        if usd_cents > cap_usd_exact * 100 and cap_usd_exact > 0:
+            shares = int(cap_usd_exact / entry + 1e-9)
+            usd_cents = _usd_cents(shares, entry)
 
         # Cap by max_position_size
-        if usd_amount > Decimal(str(max_usd)):
-            usd_amount = Decimal(str(max_usd))
-            shares = (usd_amount / entry_price).quantize(Decimal("1"), rounding="ROUND_DOWN")
-            usd_amount = (shares * entry_price).quantize(Decimal("0.01"), rounding="ROUND_DOWN")
+        if usd_cents > max_usd * 100:
+            shares = int(max_usd / entry + 1e-9)
+            usd_cents = _usd_cents(shares, entry)
 
-        return shares, usd_amount
+        return Decimal(shares), Decimal(usd_cents).scaleb(-2)
 
     def pre_trade_filters(
         self,
@@ -234,40 +351,16 @@ class RiskManager:
         """
         Run pre-trade filters. Skip if any fail.
         All optional args: if not provided, that filter is skipped.
+        Only filters enabled in settings are evaluated (see _build_pre_trade_filters).
         """
-        settings = get_settings()
-
-        if seconds_until_resolution is not None and settings.min_seconds_until_resolution > 0:
-            if seconds_until_resolution < settings.min_seconds_until_resolution:
-                return PreTradeFilterResult(
-                    allowed=False,
-                    reason=f"time_to_resolution: {seconds_until_resolution:.0f}s < {settings.min_seconds_until_resolution}s",
-                )
-
-        if settings.min_volume_60s_usd is not None and volume_60s_usd is not None:
-            if volume_60s_usd < settings.min_volume_60s_usd:
-                return PreTradeFilterResult(
-                    allowed=False,
-                    reason=f"volume_60s: ${volume_60s_usd:.0f} < ${settings.min_volume_60s_usd}",
-                )
-
-        if settings.max_zscore_3min is not None and zscore_3min is not None:
-            if abs(zscore_3min) > settings.max_zscore_3min:
-                return PreTradeFilterResult(
-                    allowed=False,
-                    reason=f"zscore_3min: {zscore_3min:.2f} > {settings.max_zscore_3min}",
-                )
-
-        if settings.max_rsi_overbought is not None and rsi_8 is not None:
-            if rsi_8 > settings.max_rsi_overbought:
-                return PreTradeFilterResult(
-                    allowed=False,
-                    reason=f"rsi_overbought: {rsi_8:.1f} > {settings.max_rsi_overbought}",
-                )
+        for check in _active_filters:
+            reason = check(seconds_until_resolution, volume_60s_usd, zscore_3min, rsi_8)
+            if reason is not None:
+                return PreTradeFilterResult(allowed=False, reason=reason)
 
-        return PreTradeFilterResult(allowed=True)
+        return _ALLOWED
 
-    def get_state(self) -> dict:
+    def get_state(self) -> dict[str, object]:
         """Current risk state for logging/dashboard."""
         return {
             "consecutive_losses": self._consecutive_losses,
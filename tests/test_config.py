@@ -0,0 +1,40 @@
+"""Tests for settings loading (rarb.config)."""
+
+from pathlib import Path
+
+from rarb.config import IntegrationsSettings, Settings
+
+# A .env following .env.example: core and integration keys in one file,
+# as deployed configs have them. Both settings models read this same file,
+# so each must ignore the other's keys.
+ENV_BOTH_GROUPS = """\
+RISK_PER_TRADE_PCT=0.9
+MAX_POSITION_SIZE=250
+STOP_LOSS_PCT=5.0
+DRY_RUN=true
+SOCKS5_PROXY_HOST=proxy.example.com
+SOCKS5_PROXY_PORT=1080
+SOCKS5_PROXY_USER=rarb
+SOCKS5_PROXY_PASS=secret
+DASHBOARD_USERNAME=admin
+DASHBOARD_PASSWORD=hunter2
+TELEGRAM_BOT_TOKEN=tok
+TELEGRAM_CHAT_ID=42
+SLACK_WEBHOOK_URL=https://hooks.slack.com/services/x
+"""
+
+
+def test_env_file_with_both_key_groups_loads(tmp_path: Path) -> None:
+    """Core and integrations models both load a .env containing all keys."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(ENV_BOTH_GROUPS)
+
+    settings = Settings(_env_file=env_file)
+    assert settings.risk_per_trade_pct == 0.9
+    assert settings.max_position_size == 250
+    assert settings.dry_run is True
+
+    integrations = IntegrationsSettings(_env_file=env_file)
+    assert integrations.socks5_proxy_host == "proxy.example.com"
+    assert integrations.dashboard_password == "hunter2"
+    assert integrations.telegram_bot_token == "tok"
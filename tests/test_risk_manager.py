@@ -0,0 +1,86 @@
+"""Tests for RiskManager position sizing (rarb.risk.manager)."""
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("rarb.utils.logging")
+
+from rarb.config import reload_settings
+from rarb.risk import RiskManager
+
+
+@pytest.fixture()
+def risk_manager(monkeypatch: pytest.MonkeyPatch) -> RiskManager:
+    """RiskManager bound to known risk settings, independent of local .env."""
+    monkeypatch.setenv("RISK_PER_TRADE_PCT", "0.8")
+    monkeypatch.setenv("STOP_LOSS_PCT", "5.0")
+    monkeypatch.setenv("POSITION_CAP_PCT", "25.0")
+    monkeypatch.setenv("MAX_POSITION_SIZE", "100")
+    reload_settings()
+    return RiskManager()
+
+
+def test_uncapped_with_default_stop(risk_manager: RiskManager) -> None:
+    # risk = 100 * 0.8% = 0.80; stop distance = 0.50 * 5% = 0.025 -> 32 shares.
+    # The quotient is exactly integer; float error must not lose a share.
+    shares, usd = risk_manager.position_size(Decimal("100"), Decimal("0.50"))
+    assert (shares, usd) == (Decimal("32"), Decimal("16.00"))
+
+
+def test_capped_by_max_position_size(risk_manager: RiskManager) -> None:
+    # Raw size is 320 shares = $160; MAX_POSITION_SIZE=100 caps at 200 shares.
+    shares, usd = risk_manager.position_size(Decimal("1000"), Decimal("0.50"))
+    assert (shares, usd) == (Decimal("200"), Decimal("100.00"))
+
+
+def test_capped_by_account_percentage(risk_manager: RiskManager) -> None:
+    # Risking 5% sizes 2000 shares = $1000; with the USD cap lifted, the 25%
+    # account cap ($250) binds instead.
+    shares, usd = risk_manager.position_size(
+        Decimal("1000"), Decimal("0.50"), risk_fraction=0.05, max_position_usd=1000.0
+    )
+    assert (shares, usd) == (Decimal("500"), Decimal("250.00"))
+
+
+def test_explicit_stop_price(risk_manager: RiskManager) -> None:
+    # risk = 0.80; distance = 0.37 - 0.33 = 0.04 -> 20 shares, floor to cents.
+    shares, usd = risk_manager.position_size(
+        Decimal("100"), Decimal("0.37"), stop_price=Decimal("0.33")
+    )
+    assert (shares, usd) == (Decimal("20"), Decimal("7.40"))
+
+
+def test_stop_above_entry_uses_minimal_distance(risk_manager: RiskManager) -> None:
+    # Non-positive risk distance falls back to 1% of entry; the resulting
+    # 216-share size is then bound by the 25% account cap ($25).
+    shares, usd = risk_manager.position_size(
+        Decimal("100"), Decimal("0.37"), stop_price=Decimal("0.40")
+    )
+    assert (shares, usd) == (Decimal("67"), Decimal("24.79"))
+
+
+def test_account_cap_is_never_exceeded(risk_manager: RiskManager) -> None:
+    # True cap is $37.2455, within half a cent below the 128-share boundary;
+    # rounding the cap to whole cents used to buy the 128th share.
+    shares, usd = risk_manager.position_size(
+        Decimal("744.91"),
+        Decimal("0.291"),
+        position_cap_fraction=0.05,
+        max_position_usd=10000.0,
+    )
+    assert (shares, usd) == (Decimal("127"), Decimal("36.95"))
+    assert usd <= Decimal("744.91") * Decimal("0.05")
+
+
+def test_max_usd_cap_respects_sub_cent_values(risk_manager: RiskManager) -> None:
+    # $8.20 exactly fits 20 shares at $0.41; $8.199 must not round up to it.
+    shares, usd = risk_manager.position_size(
+        Decimal("10000"), Decimal("0.41"), max_position_usd=8.2
+    )
+    assert (shares, usd) == (Decimal("20"), Decimal("8.20"))
+
+    shares, usd = risk_manager.position_size(
+        Decimal("10000"), Decimal("0.41"), max_position_usd=8.199
+    )
+    assert (shares, usd) == (Decimal("19"), Decimal("7.79"))